@@ -1,13 +1,10 @@
 import numpy as np
 from abc import ABC, abstractmethod
-from vMF import sample_vMF
-from astropy.coordinates import SkyCoord
-from astropy import units as u
 from scipy import stats
 from scipy.stats import rv_histogram, uniform
 from scipy.spatial.transform import Rotation as R
 from icecube_tools.utils.data import IceCubeData, find_files, data_directory
-from icecube_tools.utils.vMF import get_kappa, get_theta_p
+from icecube_tools.utils.vMF import get_kappa, get_theta_p, sample_vMF
 
 """
 Module for handling the angular resolution
@@ -102,25 +99,15 @@ class R2018AngResReader(IceCubeAngResReader):
 
         self.prob_contained = 0.68
 
-        import pandas as pd
-
         self.year = int(self._filename[-15:-11])
         self.nu_type = "nu_mu"
 
-        filelayout = ["E_min [GeV]", "E_max [GeV]", "Med. Resolution[deg]"]
-        output = pd.read_csv(
-            self._filename, comment="#", delim_whitespace=True, names=filelayout
-        ).to_dict()
-
-        true_energy_lower = set(output["E_min [GeV]"].values())
-        true_energy_upper = set(output["E_max [GeV]"].values())
+        # Columns: E_min [GeV], E_max [GeV], Med. Resolution [deg]
+        output = np.loadtxt(self._filename, comments="#", ndmin=2)
 
-        self.true_energy_bins = np.array(
-            list(true_energy_upper.union(true_energy_lower))
-        )
-        self.true_energy_bins.sort()
+        self.true_energy_bins = np.unique(np.concatenate([output[:, 0], output[:, 1]]))
 
-        self.ang_res_values = np.array(list(output["Med. Resolution[deg]"].values()))
+        self.ang_res_values = output[:, 2]
 
         self.true_energy_values = (
             self.true_energy_bins[0:-1] + np.diff(self.true_energy_bins) / 2
@@ -169,10 +156,24 @@ class AngularResolution(object):
 
             self.true_energy_values = self._reader.true_energy_values
 
+            if self.true_energy_bins is not None:
+
+                true_energy_bin_cen = (
+                    self.true_energy_bins[:-1] + self.true_energy_bins[1:]
+                ) / 2
+
+                self._log_energy_values = np.log(true_energy_bin_cen)
+
+            else:
+
+                self._log_energy_values = np.log(self.true_energy_values)
+
         elif self._energy_type == RECO_ENERGY:
 
             self.reco_energy_values = self._reader.reco_energy_values
 
+            self._log_energy_values = np.log(self.reco_energy_values)
+
         self.ang_err_p = self._reader.prob_contained
 
         self.ret_ang_err_p = ret_ang_err_p
@@ -216,27 +217,22 @@ class AngularResolution(object):
                 + " is not recognised as one of the known angular resolution files."
             )
 
-    def _get_ang_err(self, E):
+    def _get_ang_err(self, E, rng=None, log_E=None):
         """
         Get the median angular error for the
         given Etrue/Ereco, corresponding to prob_contained.
 
         If scatter, sample from a normal distribution
         centred on the median value.
-        """
-
-        # Get median value for this true energy
-        if self._energy_type == TRUE_ENERGY:
 
-            true_energy_bin_cen = (
-                self.true_energy_bins[:-1] + self.true_energy_bins[1:]
-            ) / 2
-
-            ang_res = np.interp(np.log(E), np.log(true_energy_bin_cen), self.values)
+        :param log_E: Natural log of E, if already known.
+        """
 
-        elif self._energy_type == RECO_ENERGY:
+        if log_E is None:
+            log_E = np.log(E)
 
-            ang_res = np.interp(np.log(E), np.log(self.reco_energy_values), self.values)
+        # Get median value for this true/reco energy
+        ang_res = np.interp(log_E, self._log_energy_values, self.values)
 
         # Add scatter if required
         if self._scatter:
@@ -247,10 +243,11 @@ class AngularResolution(object):
             if isinstance(ang_res, np.ndarray):
                 #shouldn't this be rvs(size=ang_res.size)?
                 ang_res = stats.truncnorm(a, b, loc=ang_res, scale=np.full(ang_res.shape, self._scatter)).rvs(
+                    random_state=rng
                 )
             else: 
                 ang_res = stats.truncnorm(a, b, loc=ang_res, scale=self._scatter,).rvs(
-                    1
+                    1, random_state=rng
                 )[0]
 
         # Check bounds
@@ -272,22 +269,27 @@ class AngularResolution(object):
 
         return ang_res
 
-    def get_ret_ang_err(self, E):
+    def get_ret_ang_err(self, E, rng=None, log_E=None):
         """
         Get the median angular resolution for the
         given Etrue/Ereco, corresponsing to ret_ang_err_p.
+
+        :param log_E: Natural log of E, if already known.
         """
 
-        ang_err = self._get_ang_err(E)
+        ang_err = self._get_ang_err(E, rng=rng, log_E=log_E)
 
         kappa = get_kappa(ang_err, self.ang_err_p)
 
         return get_theta_p(kappa, self.ret_ang_err_p)
 
-    def sample(self, Etrue, coord):
+    def sample(self, Etrue, coord, rng=None, log_E=None):
         """
         Sample new ra, dec values given a true energy
         and direction.
+
+        :param rng: numpy Generator, see utils.rng.get_rng.
+        :param log_E: Natural log of Etrue, if already known.
         """
         isarray = True
         ra, dec = coord
@@ -306,31 +308,13 @@ class AngularResolution(object):
 
         assert dec.shape == Etrue.shape
 
-        ang_err = self._get_ang_err(Etrue)
-
-        sky_coord = SkyCoord(ra=ra * u.rad, dec=dec * u.rad, frame="icrs")
-
-        sky_coord.representation_type = "cartesian"
+        ang_err = self._get_ang_err(Etrue, rng=rng, log_E=log_E)
 
-        unit_vector = np.array([sky_coord.x, sky_coord.y, sky_coord.z])
+        unit_vector = icrs_to_unit_vector(ra, dec)
         kappa = get_kappa(ang_err, self.ang_err_p)
-        new_unit_vector = sample_vMF(unit_vector, kappa)
-        
-        if new_unit_vector.shape != (3, Etrue.size):
-            new_unit_vector = new_unit_vector.T
-
-        new_sky_coord = SkyCoord(
-            x=new_unit_vector[0],
-            y=new_unit_vector[1],
-            z=new_unit_vector[2],
-            representation_type="cartesian",
-        )
-
-        new_sky_coord.representation_type = "unitspherical"
-
-        new_ra = new_sky_coord.ra.rad
+        new_unit_vector = sample_vMF(unit_vector, kappa, rng=rng)
 
-        new_dec = new_sky_coord.dec.rad
+        new_ra, new_dec = unit_vector_to_icrs(new_unit_vector)
 
         self._ret_ang_err = get_theta_p(kappa, self.ret_ang_err_p)
 
@@ -407,7 +391,7 @@ class FixedAngularResolution:
 
         self.ang_err_p = ang_err_p
 
-        self.ret_ang_err_p
+        self.ret_ang_err_p = ret_ang_err_p
 
         self._kappa = get_kappa(ang_err, ang_err_p)
 
@@ -423,67 +407,65 @@ class FixedAngularResolution:
 
         return self._kappa
 
-    def sample(self, coord):
+    def sample(self, coord, rng=None):
         """
         Sample reconstructed coord given original position.
 
-        :coord: ra, dec in [rad].
+        :coord: ra, dec in [rad], either floats or arrays.
+        :rng: numpy Generator, see utils.rng.get_rng.
         """
 
         ra, dec = coord
 
-        sky_coord = SkyCoord(ra=ra * u.rad, dec=dec * u.rad, frame="icrs")
+        isarray = isinstance(ra, np.ndarray)
 
-        sky_coord.representation_type = "cartesian"
+        ra = np.atleast_1d(ra)
+        dec = np.atleast_1d(dec)
 
-        unit_vector = np.array([sky_coord.x, sky_coord.y, sky_coord.z])
+        assert dec.shape == ra.shape
 
-        new_unit_vector = sample_vMF(unit_vector, self._kappa, 1)[0]
+        unit_vector = icrs_to_unit_vector(ra, dec)
 
-        new_sky_coord = SkyCoord(
-            x=new_unit_vector[0],
-            y=new_unit_vector[1],
-            z=new_unit_vector[2],
-            representation_type="cartesian",
-        )
+        new_unit_vector = sample_vMF(unit_vector, self._kappa, rng=rng)
 
-        new_sky_coord.representation_type = "unitspherical"
+        new_ra, new_dec = unit_vector_to_icrs(new_unit_vector)
 
-        new_ra = new_sky_coord.ra.rad
+        if not isarray:
 
-        new_dec = new_sky_coord.dec.rad
+            return new_ra[0], new_dec[0]
 
         return new_ra, new_dec
 
 
 def icrs_to_unit_vector(ra, dec):
     """
-    Convert to unit vector.
+    Convert to unit vector(s).
+
+    :param ra: RA in [rad], float or array
+    :param dec: DEC in [rad], float or array
+    :return: Unit vector components (x, y, z), floats or arrays
     """
 
-    theta = np.pi / 2 - dec
-    phi = ra
+    cos_dec = np.cos(dec)
 
-    x = np.sin(theta) * np.cos(phi)
-    y = np.sin(theta) * np.sin(phi)
-    z = np.cos(theta)
+    x = cos_dec * np.cos(ra)
+    y = cos_dec * np.sin(ra)
+    z = np.sin(dec)
 
-    return np.array([x, y, z])
+    return x, y, z
 
 
 def unit_vector_to_icrs(unit_vector):
     """
-    Convert to ra, dec.
-    """
+    Convert unit vector(s) to ra, dec.
 
-    x = unit_vector[0]
-    y = unit_vector[1]
-    z = unit_vector[2]
+    :param unit_vector: Unit vector components (x, y, z)
+    :return: RA in [0, 2pi) and DEC in [-pi/2, pi/2], [rad]
+    """
 
-    phi = np.arctan(y / x)
-    theta = np.arccos(z)
+    x, y, z = unit_vector
 
-    ra = phi
-    dec = np.pi / 2 - theta
+    ra = np.mod(np.arctan2(y, x), 2 * np.pi)
+    dec = np.arcsin(np.clip(z, -1, 1))
 
     return ra, dec
@@ -2,6 +2,7 @@ import numpy as np
 import os
 from abc import ABC, abstractmethod
 from itertools import product
+from numba import njit
 from icecube_tools.utils.data import (
     IceCubeData,
     find_files,
@@ -430,6 +431,8 @@ class EffectiveArea(object):
 
         self._integrate_out_ancillary_params()
 
+        self._scaled_values = {}
+
     def get_reader(self, **kwargs):
         """
         Define an IceCubeAeffReader based on the filename.
@@ -488,46 +491,49 @@ class EffectiveArea(object):
         a given true energy and arrival direction.
         """
 
-        #make copy of data array
-        scaled_values = self.values.copy()
-        #get lower edges of each bin, set prob to zero for all bins above inputted max energy
-        lower_bin_edges = self.true_energy_bins[:-1]
-        scaled_values[lower_bin_edges > max_energy] = 0
-        #scale to max value: Aeff -> relative detection prob
-        scaled_values = scaled_values / np.max(scaled_values)
-        #find appropriate bin of inputted energies
-        energy_index = np.digitize(true_energy, self.true_energy_bins) - 1
-
-        # Guard against overflow
-        if isinstance(energy_index, np.ndarray):
-            idx = np.nonzero(energy_index >= self.true_energy_bins.size - 1)
-            energy_index[idx] = self.true_energy_bins.size - 2
-
-            idx = np.nonzero(energy_index < 0)
-            energy_index[idx] = 0
-
-            if len(self.cos_zenith_bins) > 2:
-                cosz_index = np.digitize(true_cos_zenith, self.cos_zenith_bins) - 1
-                return scaled_values[energy_index, cosz_index]
-            else:
-                return scaled_values[energy_index]
+        scaled_values = self._get_scaled_values(max_energy)
 
-        else:
-            if energy_index >= self.true_energy_bins.size - 1:
+        true_energy, true_cos_zenith = np.broadcast_arrays(
+            np.asarray(true_energy, dtype=float),
+            np.asarray(true_cos_zenith, dtype=float),
+        )
 
-                energy_index = self.true_energy_bins.size - 2
+        detection_prob = _detection_probability_kernel(
+            true_energy.ravel(),
+            true_cos_zenith.ravel(),
+            self.true_energy_bins.astype(float),
+            np.asarray(self.cos_zenith_bins, dtype=float),
+            scaled_values,
+        )
 
-            elif energy_index < 0:
+        if true_energy.ndim == 0:
 
-                energy_index = 0
-            if len(self.cos_zenith_bins) > 2:
+            return detection_prob[0]
 
-                cosz_index = np.digitize(true_cos_zenith, self.cos_zenith_bins) - 1
-                return scaled_values[energy_index][cosz_index]
+        return detection_prob.reshape(true_energy.shape)
 
-            else:
+    def _get_scaled_values(self, max_energy):
+        """
+        Effective area scaled to a relative detection
+        probability, with all bins above max_energy set to zero.
+        Tabulated once per max_energy and reused.
+        """
 
-                return scaled_values[energy_index]
+        if max_energy not in self._scaled_values:
+
+            #make copy of data array
+            scaled_values = self.values.copy()
+            #get lower edges of each bin, set prob to zero for all bins above inputted max energy
+            lower_bin_edges = self.true_energy_bins[:-1]
+            scaled_values[lower_bin_edges > max_energy] = 0
+            #scale to max value: Aeff -> relative detection prob
+            scaled_values = scaled_values / np.max(scaled_values)
+            #tables without cos(zenith) dependence are treated as a single cosz bin
+            scaled_values = scaled_values.reshape(scaled_values.shape[0], -1)
+
+            self._scaled_values[max_energy] = scaled_values
+
+        return self._scaled_values[max_energy]
 
     @classmethod
     def from_dataset(cls, dataset_id, period="IC86_II", fetch=True, **kwargs):
@@ -593,3 +599,36 @@ class EffectiveArea(object):
                     break
         return cls(aeff_file_name, period=period, **kwargs)
 
+
+@njit(cache=True)
+def _detection_probability_kernel(
+    true_energy, true_cos_zenith, true_energy_bins, cos_zenith_bins, table
+):
+    """
+    Look up the tabulated detection probability for
+    flat arrays of true energy and cos(zenith).
+    Values outside of the bin edges are assigned
+    to the first/last bin.
+
+    :param table: Scaled effective area, shape (energy bins, cosz bins)
+    """
+
+    max_energy_index = true_energy_bins.size - 2
+    max_cosz_index = table.shape[1] - 1
+
+    detection_prob = np.empty(true_energy.size)
+
+    for i in range(true_energy.size):
+
+        energy_index = np.searchsorted(true_energy_bins, true_energy[i], side="right") - 1
+        energy_index = min(max(energy_index, 0), max_energy_index)
+
+        if max_cosz_index > 0:
+            cosz_index = np.searchsorted(cos_zenith_bins, true_cos_zenith[i], side="right") - 1
+            cosz_index = min(max(cosz_index, 0), max_cosz_index)
+        else:
+            cosz_index = 0
+
+        detection_prob[i] = table[energy_index, cosz_index]
+
+    return detection_prob
@@ -374,26 +374,33 @@ class EnergyResolution(EnergyResolutionBase):
 
         self._sigma_poly = np.poly1d(sigma_pars)
 
-    def _get_lognormal_params(self, E):
+    def _get_lognormal_params(self, E, log10_E=None):
         """
         Returns params for lognormal representing
         P(Ereco | Etrue) OR P(Etrue | Ereco).
 
         :param E: The true/reco energy if GIVEN_ETRUE/GIVEN_ERECO [GeV]
+        :param log10_E: log10(E), if already known
         """
 
-        mu = np.power(10, self._mu_poly(np.log10(E)))
+        if log10_E is None:
+            log10_E = np.log10(E)
 
-        sigma = np.power(10, self._sigma_poly(np.log10(E)))
+        mu = np.power(10, self._mu_poly(log10_E))
+
+        sigma = np.power(10, self._sigma_poly(log10_E))
 
         return mu, sigma
 
-    def sample(self, E):
+    def sample(self, E, rng=None, log10_E=None):
         """
         Sample a reco/true energy given a true/reco energy.
+
+        :param rng: numpy Generator, global state used if None.
+        :param log10_E: log10(E), if already known.
         """
 
-        mu, sigma = self._get_lognormal_params(E)
+        mu, sigma = self._get_lognormal_params(E, log10_E)
 
-        return lognorm.rvs(sigma, loc=0, scale=mu)
+        return lognorm.rvs(sigma, loc=0, scale=mu, random_state=rng)
 
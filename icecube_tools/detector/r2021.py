@@ -2,18 +2,17 @@ from asyncio.log import logger
 import numpy as np
 from scipy.stats import rv_histogram, uniform, norm
 from scipy.spatial.transform import Rotation as R
-from astropy.coordinates import SkyCoord
-from astropy import units as u
-from vMF import sample_vMF
 
 import logging
 
 from icecube_tools.detector.energy_resolution import EnergyResolution
-from icecube_tools.detector.angular_resolution import AngularResolution
+from icecube_tools.detector.angular_resolution import (
+    AngularResolution, icrs_to_unit_vector, unit_vector_to_icrs
+)
 from icecube_tools.utils.data import (
     find_files, data_directory, IceCubeData, ddict, available_irf_periods
 )
-from icecube_tools.utils.vMF import get_kappa, get_theta_p
+from icecube_tools.utils.vMF import get_kappa, get_theta_p, sample_vMF
 
 R2021_IRF_FILENAME = "smearing.csv"
 
@@ -194,10 +193,6 @@ class R2021IRF(EnergyResolution, AngularResolution):
         if not isinstance(dec, np.ndarray):
             dec = np.array([dec])
 
-        sky_coord = SkyCoord(ra=ra * u.rad, dec=dec * u.rad, frame="icrs")
-        sky_coord.representation_type = "cartesian"
-        unit_vector = np.array([sky_coord.x, sky_coord.y, sky_coord.z]).T
-
         if isinstance(Etrue, np.ndarray):
             size = Etrue.size
         else:
@@ -234,6 +229,7 @@ class R2021IRF(EnergyResolution, AngularResolution):
         Sample new ra, dec values given a true energy and direction.
         :param coord: Tuple indicident coordinates (ra, dec) in radians
         :param Etrue: True $\log_{10}(E/\mathrm{GeV})$ that's to be sampled.
+        :param seed: Random seed or numpy Generator.
         :return: new rectascension and new declination in rad of deflected particle,
                  angle between incident and deflected direction in degrees,
                  reconstructed energy in GeV
@@ -250,9 +246,7 @@ class R2021IRF(EnergyResolution, AngularResolution):
         if not isinstance(dec, np.ndarray):
             dec = np.array([dec])
 
-        sky_coord = SkyCoord(ra=ra * u.rad, dec=dec * u.rad, frame="icrs")
-        sky_coord.representation_type = "cartesian"
-        unit_vector = np.array([sky_coord.x, sky_coord.y, sky_coord.z])
+        unit_vector = icrs_to_unit_vector(ra, dec)
 
         if isinstance(Etrue, np.ndarray):
             size = Etrue.size
@@ -338,21 +332,13 @@ class R2021IRF(EnergyResolution, AngularResolution):
         kappa = get_kappa(ang_err, 0.5)
         reco_ang_err = get_theta_p(kappa, self.ret_ang_err_p)
         logger.debug(kappa.shape)
-        logger.debug(unit_vector.shape)
-        new_unit_vector = sample_vMF(unit_vector, kappa)
-        if new_unit_vector.shape != (3, Etrue.size):
-            new_unit_vector = new_unit_vector.T
-
-        #create sky coordinates from rotated/deflected vector
-        new_sky_coord = SkyCoord(
-            x=new_unit_vector[0],
-            y=new_unit_vector[1],
-            z=new_unit_vector[2],
-            representation_type="cartesian",
-        )
-        new_sky_coord.representation_type = "unitspherical"
-        new_ras = new_sky_coord.ra.rad
-        new_decs = new_sky_coord.dec.rad
+        logger.debug(unit_vector[0].shape)
+        #only reuse a Generator, an integer seed would repeat the same draws on every call
+        rng = seed if isinstance(seed, np.random.Generator) else None
+        new_unit_vector = sample_vMF(unit_vector, kappa, rng=rng)
+
+        #convert rotated/deflected vector back to ra, dec
+        new_ras, new_decs = unit_vector_to_icrs(new_unit_vector)
         logger.debug(f"reco_ang_error shape: {reco_ang_err.shape}")
         return new_ras, new_decs, reco_ang_err, np.power(10, Ereco)
 
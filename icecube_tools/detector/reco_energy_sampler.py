@@ -1,5 +1,7 @@
 import numpy as np
 
+from icecube_tools.utils.rng import get_rng
+
 """
 Wrapper for MarginalisedEnergyLikelihoodBraun2008
 to easily sampler Ereco directly form P(Ereco | index).
@@ -28,21 +30,23 @@ class RecoEnergySampler:
 
         self._min_pdf = min(pdf_vals)
 
-    def __call__(self):
+    def __call__(self, rng=None):
         """
         Sample a Ereco for a given index.
         Uses rejection sampling.
 
-        :param index: Spectral index of source
+        :param rng: numpy Generator, see utils.rng.get_rng.
         """
 
+        rng = get_rng(rng)
+
         accepted = False
 
         while not accepted:
 
-            test_log10E = np.random.uniform(1, 7)
+            test_log10E = rng.uniform(1, 7)
 
-            test_pdf = np.random.uniform(self._min_pdf, self._max_pdf)
+            test_pdf = rng.uniform(self._min_pdf, self._max_pdf)
 
             if test_pdf < self._likelihood(10 ** test_log10E, self._index):
 
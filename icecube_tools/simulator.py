@@ -2,7 +2,7 @@ import numpy as np
 from astropy.coordinates import SkyCoord
 from astropy import units as u
 import h5py
-from scipy.stats import uniform, bernoulli, truncnorm
+from scipy.stats import truncnorm
 import logging
 import sys
 from os.path import join
@@ -20,10 +20,9 @@ from .source.source_model import Source, DIFFUSE, POINT
 from .source.flux_model import PowerLawFlux, BrokenPowerLawFlux
 from .neutrino_calculator import NeutrinoCalculator
 from .detector.angular_resolution import FixedAngularResolution, AngularResolution
-# Change the imports when using a different detector model with different broken power law
-from .detector.r2021 import R2021IRF, K, EMIN, EBREAK, EMAX, INDEX1, INDEX2
+from .detector.r2021 import R2021IRF
 from .utils.data import SimEvents, available_irf_periods
-from .utils.bpl_sampling import bpl, sample_bpl
+from .utils.rng import get_rng
 from .point_source_likelihood.energy_likelihood import DataDrivenBackgroundEnergyLikelihood
 
 """
@@ -44,7 +43,7 @@ class Simulator(SimEvents):
 
         :param sources: List of/single Source object.
         """
-        super().__init__(seed=1234)
+        super().__init__(seed=seed)
         logger.debug("Instantiating simulation.")
         if not isinstance(sources, list):
             sources = [sources]
@@ -103,6 +102,10 @@ class Simulator(SimEvents):
 
         self._source_weights = np.array(self._Nex) / sum(self._Nex)
 
+        #CDF for drawing source labels, normalised to guard against rounding
+        self._source_cdf = np.cumsum(self._source_weights)
+        self._source_cdf /= self._source_cdf[-1]
+
     #@profile
     def run_energy(self, N=None, seed=1234):
         """
@@ -116,13 +119,14 @@ class Simulator(SimEvents):
         :return: Arrival energy, reconstructed energy in GeV.
         """
 
-        np.random.seed(seed)
+        #kept apart from self.rng, which SimEvents uses to scramble ra
+        self._rng = np.random.default_rng(seed)
 
         self._get_expected_number()
 
         if not N:
 
-            self.N_events = np.random.poisson(sum(self._Nex))
+            self.N_events = self._rng.poisson(sum(self._Nex))
 
         else:
 
@@ -133,14 +137,11 @@ class Simulator(SimEvents):
 
 
 
-        self._true_energy = []
-        self._arrival_energy = []
-        self._reco_energy = []
-        self.coordinate = []
-        self._ra = []
-        self._dec = []
-        self._source_label = np.zeros(self.N_events, dtype=int)
-        self._ang_err = []        
+        self._true_energy = np.zeros(self.N_events)
+        self._arrival_energy = np.zeros(self.N_events)
+        self._reco_energy = np.zeros(self.N_events)
+        self._ra = np.zeros(self.N_events)
+        self._dec = np.zeros(self.N_events)
 
         #During detector simulation, many events are discarded due to 
         #the detection probability (scaled version of the effective area).
@@ -149,18 +150,21 @@ class Simulator(SimEvents):
 
         #TODO maybe change the factor to something spectral index dependent
         num = self.N_events * 1000
-        label = np.random.choice(range(len(self.sources)), self.N_events, p=self._source_weights)
-        l_set = set(label)
-        l_num = {i: np.argwhere(i == label).shape[0] for i in l_set}
+        label = np.searchsorted(
+            self._source_cdf, self._rng.random(self.N_events), side="right"
+        )
+        #number of events per source, only simulate sources with events
+        l_num = np.bincount(label, minlength=len(self.sources))
+        l_set = np.flatnonzero(l_num)
+        #position of each source's events in the output arrays
+        l_offset = np.cumsum(l_num) - l_num
         max_energy = {}
         #create dicts of empty arrays of matching length (i.e. expected events) for each surce
         ra_d = {i: np.zeros(l_num[i]) for i in l_set}
         dec_d = {i: np.zeros(l_num[i]) for i in l_set}
         Etrue_d = {i: np.zeros(l_num[i]) for i in l_set}
         Earr_d = {i: np.zeros(l_num[i]) for i in l_set}
-        
-        accepted = np.zeros(self.N_events, dtype=bool)
- 
+
         #go over each source
         for i in l_set:
             #simulate until appropriate number of events is accepted
@@ -176,10 +180,10 @@ class Simulator(SimEvents):
                     logger.debug("no more empty slots, done")
                     break
 
-                Etrue_ = self.sources[i].flux_model.sample(num)
+                Etrue_ = self.sources[i].flux_model.sample(num, rng=self._rng)
                 if self.sources[i].source_type == DIFFUSE:
 
-                    ra_, dec_ = sphere_sample(v_min=v_min, v_max=v_max, N=num)
+                    ra_, dec_ = sphere_sample(v_min=v_min, v_max=v_max, N=num, rng=self._rng)
 
                 else:
 
@@ -191,11 +195,9 @@ class Simulator(SimEvents):
                 Earr_ = Etrue_ / (1 + self.sources[i].z)
                 detection_prob = self.detector.effective_area.detection_probability(
                         Earr_, cosz, max_energy[i]
-                ).astype(float)
-                
+                )
 
-                samples = uniform.rvs(size=num)
-                accepted_ = samples <= detection_prob
+                accepted_ = self._rng.random(num) < detection_prob
                 idx = np.nonzero(accepted_)
                 if idx[0].size == 0:
                     continue
@@ -218,22 +220,22 @@ class Simulator(SimEvents):
                         break
             
             
+            out = slice(l_offset[i], l_offset[i] + l_num[i])
+
+            self._true_energy[out] = Etrue_d[i]
+            self._arrival_energy[out] = Earr_d[i]
+            self._ra[out] = ra_d[i]
+            self._dec[out] = dec_d[i]
+
             if not isinstance(self.detector.energy_resolution, R2021IRF):
-                Ereco = self.detector.energy_resolution.sample(Earr_d[i])
-                try:
-                    self._reco_energy += list(Ereco)
-                except TypeError:
-                    self._reco_energy += [Ereco]
+                self._reco_energy[out] = self.detector.energy_resolution.sample(Earr_d[i], rng=self._rng)
             else:
                 Ereco = self.detector.energy_resolution.sample_energy(
-                    (ra_d[i], dec_d[i]), np.log10(Earr_d[i], seed=seed)
+                    (ra_d[i], dec_d[i]), np.log10(Earr_d[i]), seed=self._rng
                 )
-                try:
-                    self._reco_energy += list(np.power(10,Ereco))
-                except TypeError:
-                    self._reco_energy += [np.power(10, Ereco)]
+                self._reco_energy[out] = np.power(10, Ereco)
 
-        self._arrival_energy = np.concatenate(tuple(Earr_d[k] for k in Earr_d.keys()))
+        self._source_label = np.repeat(np.arange(len(self.sources)), l_num)
 
         return self._arrival_energy, self._reco_energy
 
@@ -256,13 +258,14 @@ class Simulator(SimEvents):
         #else:
         #    logger.basicConfig(level=logging.CRITICAL)
 
-        np.random.seed(seed)
+        #kept apart from self.rng, which SimEvents uses to scramble ra
+        self._rng = np.random.default_rng(seed)
 
         self._get_expected_number()
 
         if not N:
 
-            self.N_events = np.random.poisson(sum(self._Nex))
+            self.N_events = self._rng.poisson(sum(self._Nex))
             logger.info("Random N.")
 
         else:
@@ -270,227 +273,231 @@ class Simulator(SimEvents):
             self.N_events = int(N)
             logger.info("N provided.")
 
-        v_min = - self.max_cosz
-        v_max = - self.min_cosz
+        self._true_energy = np.zeros(self.N_events)
+        self._arrival_energy = np.zeros(self.N_events)
+        self._reco_energy = np.zeros(self.N_events)
+        self._ra = np.zeros(self.N_events)
+        self._dec = np.zeros(self.N_events)
+        self._ang_err = np.zeros(self.N_events)
+
+        label = np.searchsorted(
+            self._source_cdf, self._rng.random(self.N_events), side="right"
+        )
+        #number of events per source, only simulate sources with events
+        l_num = np.bincount(label, minlength=len(self.sources))
+        l_set = np.flatnonzero(l_num)
+        #position of each source's events in the output arrays
+        l_offset = np.cumsum(l_num) - l_num
 
-        self._true_energy = []
-        self._arrival_energy = []
-        self._reco_energy = []
-        self.coordinate = []
-        self._ra = []
-        self._dec = []
-        self._ang_err = []
-        self._source_label = []
-        #During detector simulation, many events are discarded due to 
-        #the detection probability (scaled version of the effective area).
-        #To increase speed, take many more events at once and only keep
-        #the accepted ones.
-
-        #TODO maybe change the factor to something spectral index dependent
-        num = self.N_events*10 if self.N_events*10 < 30000 else 30000
-        label = np.random.choice(range(len(self.sources)), self.N_events, p=self._source_weights)
-        l_set = set(label)
-        l_num = {i: np.argwhere(i == label).shape[0] for i in l_set}
-        max_energy = {}
-        #create dicts of empty arrays of matching length (i.e. expected events) for each surce
-        ra_d = {i: np.zeros(l_num[i]) for i in l_set}
-        dec_d = {i: np.zeros(l_num[i]) for i in l_set}
-        Etrue_d = {i: np.zeros(l_num[i]) for i in l_set}
-        Earr_d = {i: np.zeros(l_num[i]) for i in l_set}
-        
         if show_progress:
             progress = progress_bar(range(self.N_events), desc="Sampling", position=0, leave=True)
         #go over each source
         for i in l_set:
-            #simulate until appropriate number of events is accepted
-            
-            max_energy[i] = self.sources[i].flux_model._upper_energy
-            
+
             logger.info(f"Simulating source {i}")
-            not_done = True
-            while not_done:
-                #check if data is needed, else break loop
-                where_zero = np.argwhere(Etrue_d[i] == 0.)
-                if where_zero.size == 0:
-                    logger.debug("no more empty slots, done")
-                    break
-                
-                # Etrue_ = self.sources[i].flux_model.sample(num)
-                # Should be the other way: Sample Earr, then calculate Etrue.
-                # Cuts on energy are applied at the detector, not at the source.
-                # Actually necessary for the bpl rejection sampling to work
-                if self.sources[i].source_type == DIFFUSE:
 
-                    ra_, dec_ = sphere_sample(v_min=v_min, v_max=v_max, N=num)
+            out = slice(l_offset[i], l_offset[i] + l_num[i])
 
-                else:
+            Earr, ra, dec = self._sample_detected(self.sources[i], l_num[i], self._rng)
 
-                    ra_, dec_ = np.full(num, self.sources[i].coord[0]), np.full(num, self.sources[i].coord[1])
+            self._arrival_energy[out] = Earr
+            self._true_energy[out] = Earr * (1 + self.sources[i].z)
 
-                cosz = -np.sin(dec_)
+            #shared by the energy and angular resolutions, ln(E) = log10(E) * ln(10)
+            log10_Earr = np.log10(Earr)
+            log_Earr = log10_Earr * np.log(10)
 
+            if not isinstance(self.detector.energy_resolution, R2021IRF):
+                logger.debug("Sampled reco energy")
+                self._reco_energy[out] = self.detector.energy_resolution.sample(
+                    Earr, rng=self._rng, log10_E=log10_Earr
+                )
 
-                # Earr_ = Etrue_ / (1 + self.sources[i].z)
-                u = uniform.rvs(size=num)
-                Earr_ = sample_bpl(u, EMIN, EBREAK, max_energy[i], INDEX1, INDEX2)
-                detection_prob = self.sources[i].flux_model.spectrum(Earr_) * self.detector.effective_area.detection_probability(
-                        Earr_, cosz, max_energy[i]
-                ).astype(float)
-                # print("Eprelim:", Eprelim)
-                # print("unscaled detection prob:", detection_prob)
-                bpl_values = bpl(Earr_, EMIN, EBREAK, max_energy[i], INDEX1, INDEX2)
-                # print("bpl_values:", bpl_values)
-                prob = detection_prob / bpl_values
-                # print("relative prob max:", prob.max())
-                prob /= prob.max()
-                # print("prob:", prob, prob.max())
-
-                accepted_ = bernoulli.rvs(prob).astype(bool)
-
-                # Earr_ = Eprelim[accepted_]
-                Etrue_ = Earr_ * (1 + self.sources[i].z)
-                #samples = uniform.rvs(size=num, random_state=seed)
-                #accepted_ = samples <= detection_prob
-                idx = np.nonzero(accepted_)
-                if idx[0].size == 0:
-                    continue
-                else:
-                    start = np.min(where_zero)
-                    end = start + idx[0].size
-                    # 
-                    try:
-                        Etrue_d[i][start:end] = Etrue_[idx]
-                        Earr_d[i][start:end] = Earr_[idx]
-                        ra_d[i][start:end] = ra_[idx]
-                        dec_d[i][start:end] = dec_[idx]
-                        logger.debug("All data placed.")
-                        if show_progress:
-                            progress.update(idx[0].size)
-                        num_samples = idx[0].size
-                        # print("start:end", start, end)
-                    except (IndexError, ValueError):
-                        logger.debug("Not enough slots, cutting short.")
-                        remaining = np.argwhere(Etrue_d[i] == 0.).size
-                        end = start + remaining
-                        # print("start:end", start, end)
-                        # print("remaining:", remaining)
-                        # print(Etrue_[idx][0:remaining])
-                        # print(Etrue_d[i])
-                        Etrue_d[i][start:] = Etrue_[idx][0:remaining]
-                        Earr_d[i][start:] = Earr_[idx][0:remaining]
-                        ra_d[i][start:] = ra_[idx][0:remaining]
-                        dec_d[i][start:] = dec_[idx][0:remaining]
-                        if show_progress:
-                            progress.update(remaining)
-                        not_done = False
-                    finally:
-                        if not isinstance(self.detector.energy_resolution, R2021IRF):
-                            logger.debug("Sampled reco energy")
-                            Ereco = self.detector.energy_resolution.sample(Earr_d[i][start:end])
-                            #this and all following try-except TypeError blocks
-                            #are needed if only a single event is sampled
-                            #then list() will not work bc float is not an iterable
-                            try:
-                                self._reco_energy += list(Ereco)           
-                            except TypeError:
-                                self._reco_energy += [Ereco]
-
-                        #do source type specific things here
-                        if self.sources[i].source_type == DIFFUSE:
-
-                            logger.debug("Sampling angular uncertainty for diffuse source")
-                            if isinstance(self.detector.angular_resolution, R2021IRF):
-                                _, _, reco_ang_err, Ereco = self.detector.angular_resolution.sample(
-                                    (ra_d[i][start:end], dec_d[i][start:end]),
-                                    np.log10(Earr_d[i][start:end]),
-                                    seed=seed
-                                )
-                                try:
-                                    self._ang_err += list(reco_ang_err)
-                                    self._reco_energy += list(Ereco)
-                                except TypeError as e:
-                                    print(e)
-                                    self._ang_err += [reco_ang_err]
-                                    self._reco_energy += [Ereco]
-                                    
-                            elif isinstance(self.detector.angular_resolution, AngularResolution):
-                                reco_ang_err = self.detector.angular_resolution.get_ret_ang_err(
-                                    Earr_d[i][start:end]
-                                )
-                                try:
-                                    self._ang_err += list(reco_ang_err)
-                                except TypeError:
-                                    self._ang_err += [reco_ang_err]
-                            elif isinstance(
-                                self.detector.angular_resolution, FixedAngularResolution
-                            ):
-                                reco_ang_err = self.detector.angular_resolution.ret_ang_err
-                                #TODO fix
-                                logger.warning("Fixed angular resolution not tested, proceed at your own risk!")
-                                temp = [reco_ang_err] * l_num[i]
-
-                            try:
-                                self._dec += list(dec_d[i][start:end])
-                                self._ra += list(ra_d[i][start:end])
-                            except TypeError:
-                                self._dec += [dec_d[i]]
-                                self._ra += [ra_d[i]]
-                            logger.debug("Sampled angular uncertainty for diffuse source")
-
-                        else:
-
-                            logger.debug("Sampling angular uncertainty for point source")
-                            if isinstance(self.detector.angular_resolution, R2021IRF):
-                                #loop over events handled inside R2021IRF
-                                reco_ra, reco_dec, reco_ang_err, Ereco = self.detector.angular_resolution.sample(
-                                    (ra_d[i][start:end], dec_d[i][start:end]),
-                                    np.log10(Earr_d[i][start:end]),
-                                    seed=seed)
-                                self._reco_energy += list(Ereco)
-
-                            elif isinstance(self.detector.angular_resolution, AngularResolution):
-                                reco_ra, reco_dec = self.detector.angular_resolution.sample(
-                                    Earr_d[i][start:end],
-                                    (ra_d[i][start:end], dec_d[i][start:end])
-                                )
-                                reco_ang_err = self.detector.angular_resolution.ret_ang_err
-
-                            elif isinstance(
-                                self.detector.angular_resolution, FixedAngularResolution
-                            ):
-                                reco_ra, reco_dec = self.detector.angular_resolution.sample(
-                                    (ra_d[i][start:end], dec_d[i][start:end])
-                                )
-                                reco_ang_err = self.detector.angular_resolution.ret_ang_err
-                            try:
-                                self._ang_err +=list(reco_ang_err)
-                                self._dec += list(reco_dec)
-                                self._ra += list(reco_ra)
-                            except TypeError as e:
-                                print(e)
-                                self._ang_err += [reco_ang_err]
-                                self._dec += [reco_dec]
-                                self._ra += [reco_ra]
-                            logger.debug("Sampled angular uncertainty for point source")
-
-        logger.debug("Creating array of simulation data")  
-        self._true_energy = np.concatenate(tuple(Etrue_d[k] for k in Earr_d.keys()))
-        self._arrival_energy = np.concatenate(tuple(Earr_d[k] for k in Earr_d.keys()))
-        self._source_label = np.concatenate(tuple(np.full(l_num[l], l, dtype=int) for l in Earr_d.keys()))
+            #do source type specific things here
+            if self.sources[i].source_type == DIFFUSE:
+
+                logger.debug("Sampling angular uncertainty for diffuse source")
+                if isinstance(self.detector.angular_resolution, R2021IRF):
+                    _, _, reco_ang_err, Ereco = self.detector.angular_resolution.sample(
+                        (ra, dec),
+                        log10_Earr,
+                        seed=self._rng
+                    )
+                    self._reco_energy[out] = Ereco
+
+                elif isinstance(self.detector.angular_resolution, AngularResolution):
+                    reco_ang_err = self.detector.angular_resolution.get_ret_ang_err(
+                        Earr, rng=self._rng, log_E=log_Earr
+                    )
+
+                elif isinstance(
+                    self.detector.angular_resolution, FixedAngularResolution
+                ):
+                    reco_ang_err = self.detector.angular_resolution.ret_ang_err
+
+                self._ang_err[out] = reco_ang_err
+                self._ra[out] = ra
+                self._dec[out] = dec
+                logger.debug("Sampled angular uncertainty for diffuse source")
+
+            else:
+
+                logger.debug("Sampling angular uncertainty for point source")
+                if isinstance(self.detector.angular_resolution, R2021IRF):
+                    #loop over events handled inside R2021IRF
+                    reco_ra, reco_dec, reco_ang_err, Ereco = self.detector.angular_resolution.sample(
+                        (ra, dec),
+                        log10_Earr,
+                        seed=self._rng)
+                    self._reco_energy[out] = Ereco
+
+                elif isinstance(self.detector.angular_resolution, AngularResolution):
+                    reco_ra, reco_dec = self.detector.angular_resolution.sample(
+                        Earr,
+                        (ra, dec),
+                        rng=self._rng,
+                        log_E=log_Earr,
+                    )
+                    reco_ang_err = self.detector.angular_resolution.ret_ang_err
+
+                elif isinstance(
+                    self.detector.angular_resolution, FixedAngularResolution
+                ):
+                    reco_ra, reco_dec = self.detector.angular_resolution.sample(
+                        (ra, dec), rng=self._rng
+                    )
+                    reco_ang_err = self.detector.angular_resolution.ret_ang_err
+
+                self._ang_err[out] = reco_ang_err
+                self._dec[out] = reco_dec
+                self._ra[out] = reco_ra
+                logger.debug("Sampled angular uncertainty for point source")
+
+            if show_progress:
+                progress.update(l_num[i])
+
+        self._source_label = np.repeat(np.arange(len(self.sources)), l_num)
         if show_progress:
             progress.close()
-        logger.debug("Created array of simulation data")
 
-        self._ra = {self._period: np.array(self._ra)}
-        self._dec = {self._period: np.array(self._dec)}
+        self._ra = {self._period: self._ra}
+        self._dec = {self._period: self._dec}
         self._true_energy = {self._period: self._true_energy}
-        self._reco_energy = {self._period: np.array(self._reco_energy)}
+        self._reco_energy = {self._period: self._reco_energy}
         self._arrival_energy = {self._period: self._arrival_energy}
         self._source_label = {self._period: self._source_label}
-        self._ang_err = {self._period: np.array(self._ang_err)}
+        self._ang_err = {self._period: self._ang_err}
         
  
 
+    def _sample_detected(self, source, N, rng):
+        """
+        Sample arrival energies and directions of N detected
+        events from source.
+
+        The arrival energy and cos(zenith) are drawn jointly
+        from spectrum * detection probability, tabulated on cells
+        following the effective area binning. Cells are picked from
+        the cumulative weights, then energies are drawn inside each cell
+        treating the spectrum as a power law between the cell edges.
+        No events are rejected.
+
+        :param source: Instance of Source.
+        :param N: Number of events.
+        :param rng: numpy Generator.
+        :return: Arrival energy [GeV], ra, dec [rad].
+        """
+
+        effective_area = self.detector.effective_area
+        flux_model = source.flux_model
+        max_energy = flux_model._upper_energy
+
+        #Sub-divide the effective area energy bins within the flux bounds
+        #so that the spectrum is close to a power law inside each cell.
+        #A spectral break is made a cell edge, so that broken power laws
+        #are an exact power law inside every cell.
+        n_sub = 10
+        bins = effective_area.true_energy_bins
+        lower = max(flux_model._lower_energy, bins[0])
+        upper = min(flux_model._upper_energy, bins[-1])
+        break_energy = getattr(flux_model, "_break_energy", None)
+        if break_energy is not None:
+            bins = np.append(bins, break_energy)
+        edges = np.unique(np.clip(bins, lower, upper))
+        ratio = (edges[1:] / edges[:-1])[:, np.newaxis]
+        edges = np.append(
+            (edges[:-1, np.newaxis] * ratio ** (np.arange(n_sub) / n_sub)).ravel(),
+            edges[-1],
+        )
+
+        #Local power law through the spectrum at the cell edges,
+        #all cell quantities are expressed in log(E)
+        spectrum = flux_model.spectrum(edges)
+        log_width = np.log(edges[1:] / edges[:-1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = np.log(spectrum[1:] / spectrum[:-1]) / log_width + 1
+            integral = spectrum[:-1] * edges[:-1] * np.where(
+                slope == 0, log_width, np.expm1(slope * log_width) / slope
+            )
+        integral[~np.isfinite(integral)] = 0
+
+        E_cen = np.sqrt(edges[1:] * edges[:-1])
+
+        if source.source_type == DIFFUSE:
+
+            if len(effective_area.cos_zenith_bins) > 2:
+                cosz_edges = np.unique(
+                    np.clip(effective_area.cos_zenith_bins, self.min_cosz, self.max_cosz)
+                )
+            else:
+                cosz_edges = np.array([self.min_cosz, self.max_cosz])
+            cosz_width = np.diff(cosz_edges)
+            cosz_cen = cosz_edges[:-1] + cosz_width / 2
+
+            detection_prob = effective_area.detection_probability(
+                E_cen[:, np.newaxis], cosz_cen[np.newaxis, :], max_energy
+            )
+            weights = integral[:, np.newaxis] * detection_prob * cosz_width
+
+        else:
+
+            cosz = -np.sin(source.coord[1])
+            detection_prob = effective_area.detection_probability(E_cen, cosz, max_energy)
+            weights = (integral * detection_prob)[:, np.newaxis]
+
+        cdf = np.cumsum(weights.ravel())
+
+        #empty if the flux bounds do not overlap the effective area
+        if cdf.size == 0 or not cdf[-1] > 0:
+
+            raise ValueError("Source has zero detection probability.")
+
+        cell = np.searchsorted(cdf / cdf[-1], rng.random(N), side="right")
+        E_idx, cosz_idx = np.unravel_index(cell, weights.shape)
+
+        #Inverse transform sampling of the local power law
+        u = rng.random(N)
+        a = slope[E_idx] * log_width[E_idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_E = np.where(
+                a == 0,
+                u * log_width[E_idx],
+                np.log1p(u * np.expm1(a)) / slope[E_idx],
+            )
+        Earr = edges[E_idx] * np.exp(log_E)
+
+        if source.source_type == DIFFUSE:
+
+            ra = 2 * np.pi * rng.random(N)
+            cosz = cosz_edges[cosz_idx] + cosz_width[cosz_idx] * rng.random(N)
+            dec = np.arcsin(-cosz)
+
+        else:
+
+            ra, dec = np.full(N, source.coord[0]), np.full(N, source.coord[1])
+
+        return Earr, ra, dec
+
     def save(self, filename):
         """
         Save the output to filename, for all but the R2021 release.
@@ -498,21 +505,23 @@ class Simulator(SimEvents):
 
         self._filename = filename
 
+        p = self._period
+
         with h5py.File(filename, "w") as f:
 
-            f.create_dataset("true_energy", data=self.true_energy)
+            _write_dataset(f, "true_energy", self.true_energy[p])
 
-            f.create_dataset("arrival_energy", data=self.arrival_energy)
+            _write_dataset(f, "arrival_energy", self.arrival_energy[p])
 
-            f.create_dataset("reco_energy", data=self.reco_energy)
+            _write_dataset(f, "reco_energy", self.reco_energy[p])
 
-            f.create_dataset("ra", data=self.ra)
+            _write_dataset(f, "ra", self.ra[p])
 
-            f.create_dataset("dec", data=self.dec)
+            _write_dataset(f, "dec", self.dec[p])
 
-            f.create_dataset("ang_err", data=self.ang_err)
+            _write_dataset(f, "ang_err", self.ang_err[p])
 
-            f.create_dataset("source_label", data=self.source_label)
+            _write_dataset(f, "source_label", self.source_label[p])
 
             for i, source in enumerate(self.sources):
 
@@ -579,21 +588,27 @@ class Braun2008Simulator:
         self.min_cosz = -1.
         self.reco_energy_index = 3.8
 
-    def run(self, N, show_progress=True):
+        self._coordinate = None
+
+    def run(self, N, show_progress=True, seed=None):
         """
         Run the simulation.
 
         :param N: Number of events to simulate.
+        :param seed: Random seed, the global numpy random state is used if None.
         """
 
+        if seed is None:
+            self._rng = get_rng()
+        else:
+            self._rng = np.random.default_rng(seed)
+
         self.N_events = N
 
-        self._true_energy = []
-        self._reco_energy = []
-        self.coordinate = []
-        self._ra = []
-        self._dec = []
-        self._source_label = []
+        self._true_energy = np.zeros(self.N_events)
+        self._ra = np.zeros(self.N_events)
+        self._dec = np.zeros(self.N_events)
+        self._source_label = np.zeros(self.N_events, dtype=int)
 
         self.reco_energy_sampler.set_index(self.reco_energy_index)
 
@@ -602,58 +617,82 @@ class Braun2008Simulator:
 
         max_energy = self.source.flux_model._upper_energy
 
-        for i in progress_bar(
-            range(self.N_events), desc="Sampling", disable=(not show_progress)
-        ):
+        #Draw candidate events in batches and only keep the accepted ones,
+        #instead of running the rejection sampling one event at a time.
+        num = self.N_events*10 if self.N_events*10 < 30000 else 30000
 
-            accepted = False
+        progress = progress_bar(
+            total=self.N_events, desc="Sampling", disable=(not show_progress)
+        )
 
-            while not accepted:
+        n_accepted = 0
 
-                Etrue = self.source.flux_model.sample(1)[0]
+        while n_accepted < self.N_events:
 
-                if self.source.source_type == DIFFUSE:
+            Etrue = self.source.flux_model.sample(num, rng=self._rng)
 
-                    ra, dec = sphere_sample(v_min=v_min, v_max=v_max)
+            if self.source.source_type == DIFFUSE:
 
-                else:
+                ra, dec = sphere_sample(v_min=v_min, v_max=v_max, N=num, rng=self._rng)
 
-                    ra, dec = self.source.coord
+            else:
 
-                cosz = -np.sin(dec)
+                ra, dec = np.full(num, self.source.coord[0]), np.full(num, self.source.coord[1])
 
-                detection_prob = float(
-                    self.effective_area.detection_probability(Etrue, cosz, max_energy)
-                )
+            cosz = -np.sin(dec)
 
-                accepted = np.random.choice(
-                    [True, False], p=[detection_prob, 1 - detection_prob]
-                )
+            detection_prob = self.effective_area.detection_probability(
+                Etrue, cosz, max_energy
+            )
 
-            self._true_energy.append(Etrue)
+            accepted = self._rng.random(num) < detection_prob
 
-            Ereco = self.reco_energy_sampler()
-            self._reco_energy.append(Ereco)
+            idx = np.nonzero(accepted)[0][: self.N_events - n_accepted]
 
-            if self.source.source_type == DIFFUSE:
+            end = n_accepted + idx.size
 
-                self.coordinate.append(SkyCoord(ra * u.rad, dec * u.rad, frame="icrs"))
-                self._ra.append(ra)
-                self._dec.append(dec)
+            self._true_energy[n_accepted:end] = Etrue[idx]
+            self._ra[n_accepted:end] = ra[idx]
+            self._dec[n_accepted:end] = dec[idx]
 
-            else:
+            progress.update(idx.size)
+
+            n_accepted = end
+
+        progress.close()
 
-                if isinstance(self.angular_resolution, AngularResolution):
-                    reco_ra, reco_dec = self.angular_resolution.sample(Etrue, (ra, dec))
+        self._reco_energy = np.array(
+            [self.reco_energy_sampler(rng=self._rng) for _ in range(self.N_events)]
+        )
 
-                elif isinstance(self.angular_resolution, FixedAngularResolution):
-                    reco_ra, reco_dec = self.angular_resolution.sample((ra, dec))
+        if self.source.source_type != DIFFUSE:
+
+            if isinstance(self.angular_resolution, AngularResolution):
+                self._ra, self._dec = self.angular_resolution.sample(
+                    self._true_energy, (self._ra, self._dec), rng=self._rng
+                )
 
-                self.coordinate.append(
-                    SkyCoord(reco_ra * u.rad, reco_dec * u.rad, frame="icrs")
+            elif isinstance(self.angular_resolution, FixedAngularResolution):
+                self._ra, self._dec = self.angular_resolution.sample(
+                    (self._ra, self._dec), rng=self._rng
                 )
-                self._ra.append(reco_ra)
-                self._dec.append(reco_dec)
+
+        self._coordinate = None
+
+    @property
+    def coordinate(self):
+        """
+        Sky coordinates of the simulated events,
+        only built on first access.
+        """
+
+        if self._coordinate is None:
+
+            self._coordinate = SkyCoord(
+                self._ra * u.rad, self._dec * u.rad, frame="icrs"
+            )
+
+        return self._coordinate
 
     '''
     def save(self, filename):
@@ -705,7 +744,7 @@ class BackgroundSimulator(SimEvents):
     def run(self, n: int, seed: int=42):
         
         # first sample ra's and decs
-        ra, _ = sphere_sample(N=n)
+        ra, _ = sphere_sample(N=n, rng=np.random.default_rng(seed))
         cos_theta = self.likelihood._costheta_rv_histogram.rvs(size=n, random_state=seed)
         ra, dec = spherical_to_icrs(np.arccos(cos_theta), ra)
         log_ereco = self.likelihood.sample(dec, seed)
@@ -881,18 +920,23 @@ class TimeDependentSimulator(SimEvents):
 
 
     
-def sphere_sample(radius=1, v_min=-1, v_max=1, N=1):
+def sphere_sample(radius=1, v_min=-1, v_max=1, N=1, rng=None):
     """
-    Sample points uniformly on a sphere.
+    Sample N points uniformly on a sphere.
+
+    :param v_min: Lower bound of cos(theta) = sin(dec).
+    :param v_max: Upper bound of cos(theta) = sin(dec).
+    :param N: Number of points.
+    :param rng: numpy Generator, see utils.rng.get_rng.
+    :return: Arrays of ra, dec in [rad].
     """
 
-    u = np.random.uniform(0, 1, size=N)
-    v = np.random.uniform(v_min, v_max, size=N)
+    rng = get_rng(rng)
 
-    phi = 2 * np.pi * u
-    theta = np.arccos(v)
+    u, v = rng.random(size=(2, N))
 
-    ra, dec = spherical_to_icrs(theta, phi)
+    ra = 2 * np.pi * u
+    dec = np.arcsin(v_min + (v_max - v_min) * v)
 
     return ra, dec
 
@@ -910,6 +954,33 @@ def spherical_to_icrs(theta, phi):
     return ra, dec
 
 
+def _write_dataset(f, name, data):
+    """
+    Write an event array to an open hdf5 file or group,
+    chunked and lzf-compressed.
+
+    :param f: h5py File or Group.
+    :param name: Dataset name.
+    :param data: Array of event values.
+    """
+
+    data = np.asarray(data)
+
+    # Empty and scalar datasets cannot be chunked
+    if data.ndim == 0 or data.size == 0:
+
+        return f.create_dataset(name, data=data)
+
+    return f.create_dataset(
+        name, data=data, chunks=True, compression="lzf", shuffle=True
+    )
+
+
 def lists_to_tuple(list1, list2):
+    """
+    Pair up two equal-length sequences.
+
+    :return: Array of shape (N, 2), row i is (list1[i], list2[i]).
+    """
 
-    return [(list1[i], list2[i]) for i in range(0, len(list1))]
+    return np.column_stack([list1, list2])
@@ -156,16 +156,17 @@ class PowerLawFlux(FluxModel):
         int_norm = norm / (np.power(self._normalisation_energy, -index) * (2 - index))
         return int_norm * (np.power(upper, 2 - index) - np.power(lower, 2 - index))
 
-    def sample(self, N):
+    def sample(self, N, rng=None):
         """
         Sample energies from the power law.
         Uses inverse transform sampling.
 
         :param min_energy: Minimum energy to sample from [GeV].
         :param N: Number of samples.
+        :param rng: numpy Generator, see utils.rng.get_rng.
         """
 
-        return self.power_law.samples(N)
+        return self.power_law.samples(N, rng=rng)
 
     def _rejection_sample(self, min_energy):
         """
@@ -362,15 +363,16 @@ class BrokenPowerLawFlux(FluxModel):
     def redshift_factor(self, z: float):
         return 1.0
 
-    def sample(self, N):
+    def sample(self, N, rng=None):
         """
         Sample energies from the power law.
         Uses inverse transform sampling.
 
         :param N: Number of samples.
+        :param rng: numpy Generator, see utils.rng.get_rng.
         """
 
-        return self.power_law.samples(N)
+        return self.power_law.samples(N, rng=rng)
 
 
 class PowerLawExpCutoffFlux(FluxModel):
@@ -470,10 +472,11 @@ class PowerLawExpCutoffFlux(FluxModel):
     def redshift_factor(self, z: float):
         return 1.0
 
-    def sample(self, N):
+    def sample(self, N, rng=None):
         """
         Samples energies from the spectrum using inverse transform sampling.
         Works only if index < 1.
         :param N: Number of samples.
+        :param rng: numpy Generator, see utils.rng.get_rng.
         """
-        return self.power_law.samples(N)
+        return self.power_law.samples(N, rng=rng)
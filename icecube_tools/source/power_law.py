@@ -2,6 +2,7 @@ import numpy as np
 import mpmath as mp
 import scipy.special as sc
 from scipy.stats import bernoulli, uniform
+from icecube_tools.utils.rng import get_rng
 
 
 class BoundedPowerLaw(object):
@@ -96,11 +97,12 @@ class BoundedPowerLaw(object):
                 (x * self.inv_cdf_factor) + self.inv_cdf_const, self.inv_cdf_gamma
             )
 
-    def samples(self, nsamples):
+    def samples(self, nsamples, rng=None):
         """
         Inverse CDF sample from the bounded power law distribution.
         """
-        u = np.random.uniform(0, 1, size=nsamples)
+        rng = get_rng(rng)
+        u = rng.uniform(0, 1, size=nsamples)
         return self.inv_cdf(u)
 
 
@@ -165,18 +167,21 @@ class BrokenBoundedPowerLaw:
 
         return w1, w2, total
 
-    def samples(self, N):
+    def samples(self, N, rng=None):
         """
         Sample from the broken power law.
 
         :param N: number of samples.
+        :param rng: numpy Generator, see utils.rng.get_rng.
         """
 
-        u = np.random.uniform(0, 1, N)
+        rng = get_rng(rng)
+
+        u = rng.uniform(0, 1, N)
 
         output = np.empty_like(u)
 
-        idx = bernoulli.rvs(self.weights[0], size=len(u)).astype(bool)
+        idx = bernoulli.rvs(self.weights[0], size=len(u), random_state=rng).astype(bool)
 
         output[idx] = np.power(
             u[idx]
@@ -271,10 +276,11 @@ class BoundedPowerLawExpCutoff:
         else:
             raise ValueError('Inverse CDF can only be calculated for gamma < 1.')
 
-    def samples(self, nsamples):
+    def samples(self, nsamples, rng=None):
         """
         Inverse transform sampling from the bounded power law distribution
         with exponential cutoff. Works only for gamma < 1.
         """
-        u = np.random.uniform(0, 1, size=nsamples)
+        rng = get_rng(rng)
+        u = rng.uniform(0, 1, size=nsamples)
         return self.inv_cdf(u)
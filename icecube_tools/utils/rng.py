@@ -0,0 +1,24 @@
+import numpy as np
+
+"""
+Random number generator handling shared by the samplers.
+"""
+
+
+def get_rng(rng=None):
+    """
+    Random number generator to draw from.
+
+    Samplers take an optional rng argument. If it is None,
+    draws come from the global numpy random state, so that
+    np.random.seed still makes results reproducible.
+
+    :param rng: numpy Generator or None
+    :return: rng, or the np.random module if rng is None
+    """
+
+    if rng is None:
+
+        return np.random
+
+    return rng
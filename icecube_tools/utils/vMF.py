@@ -1,9 +1,14 @@
 import numpy as np
 
+from icecube_tools.utils.rng import get_rng
+
 """
 Conversion between kappa and angular radius.
 
 Based on Equation 11 in Soiaporn et al. 2013.
+
+Also batched sampling from the vMF distribution
+on the unit sphere.
 """
 
 
@@ -34,3 +39,55 @@ def get_theta_p(kappa, p=0.68):
     theta_p = np.sqrt((-2 / kappa) * np.log(1 - p))
 
     return np.rad2deg(theta_p)
+
+
+def sample_vMF(mu, kappa, rng=None):
+    """
+    Sample one direction from each of N vMF distributions
+    on the unit sphere.
+
+    On the sphere the cosine of the angle to the mean direction,
+    w, can be drawn by inverse transform sampling (Wood 1994),
+    so no rejection step is needed. Samples drawn around the z-axis
+    are then rotated onto each mean direction.
+
+    :param mu: Mean directions as unit vector components (x, y, z),
+        each float or array of length N
+    :param kappa: Shape parameter(s), float or array of length N
+    :param rng: numpy Generator, see utils.rng.get_rng
+    :return: Sampled unit vector components (x, y, z), arrays of length N
+    """
+
+    rng = get_rng(rng)
+
+    x, y, z = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(c, dtype=float)) for c in mu)
+    )
+
+    N = x.size
+
+    kappa = np.broadcast_to(np.asarray(kappa, dtype=float), (N,))
+
+    # 1 - w, written to avoid cancellation for large kappa
+    u = 1.0 - rng.uniform(size=N)
+    t = -np.log(u + (1 - u) * np.exp(-2 * kappa)) / kappa
+
+    phi = rng.uniform(0, 2 * np.pi, size=N)
+    sin_theta = np.sqrt(t * (2 - t))
+
+    # Sample around the z-axis
+    v_x = sin_theta * np.cos(phi)
+    v_y = sin_theta * np.sin(phi)
+    v_z = 1 - t
+
+    # Rotate onto mu using the orthonormal basis (e1, e2, mu)
+    # of Duff et al. 2017, which is stable at both poles
+    sign = np.where(z >= 0, 1.0, -1.0)
+    a = -1 / (sign + z)
+    b = x * y * a
+
+    new_x = (1 + sign * x**2 * a) * v_x + b * v_y + x * v_z
+    new_y = sign * b * v_x + (sign + y**2 * a) * v_y + y * v_z
+    new_z = -sign * x * v_x - y * v_y + z * v_z
+
+    return new_x, new_y, new_z
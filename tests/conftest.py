@@ -15,3 +15,70 @@ def random_seed():
     seed = 42
 
     return seed
+
+
+@pytest.fixture(scope="session")
+def synthetic_aeff_file(output_directory):
+    """
+    Small effective area table in the format of the
+    2018 Oct 18 release, so that tests do not need to
+    download any data.
+    """
+
+    import numpy as np
+
+    true_energy_bins = np.logspace(2, 9, 29)
+    cos_zenith_bins = np.linspace(-1, 1, 11)
+
+    filename = output_directory.join("IC86_2012_TabulatedAeff.txt")
+
+    with open(filename, "w") as f:
+
+        f.write("# E_min [GeV] E_max [GeV] cos(z)_min cos(z)_max Aeff [m^2]\n")
+
+        for Emin, Emax in zip(true_energy_bins[:-1], true_energy_bins[1:]):
+
+            for czmin, czmax in zip(cos_zenith_bins[:-1], cos_zenith_bins[1:]):
+
+                # Rises with energy, larger for up-going events
+                aeff = np.log10(np.sqrt(Emin * Emax)) ** 2 * (1.5 - (czmin + czmax) / 2)
+
+                f.write(f"{Emin:e} {Emax:e} {czmin:.2f} {czmax:.2f} {aeff:e}\n")
+
+    return str(filename)
+
+
+@pytest.fixture(scope="session")
+def synthetic_eres_file(output_directory):
+    """
+    Effective area table including reco energy in the
+    format of the 2015 Aug 20 release, from which
+    EnergyResolution fits a lognormal with mu = Etrue
+    and sigma = 0.5.
+    """
+
+    import h5py
+    import numpy as np
+    from scipy.stats import lognorm
+
+    true_energy_bins = np.logspace(2, 9, 221)
+    cos_zenith_bins = np.array([-1.0, 0.0, 1.0])
+    reco_energy_bins = np.logspace(1, 10, 181)
+
+    true_energy_cen = np.sqrt(true_energy_bins[1:] * true_energy_bins[:-1])
+    reco_energy_cen = (reco_energy_bins[1:] + reco_energy_bins[:-1]) / 2
+
+    area = lognorm.pdf(reco_energy_cen[np.newaxis, :], 0.5, scale=true_energy_cen[:, np.newaxis])
+    area = np.repeat(area[:, np.newaxis, :], len(cos_zenith_bins) - 1, axis=1)
+
+    filename = output_directory.join("effective_area.h5")
+
+    with h5py.File(filename, "w") as f:
+
+        directory = f.create_group("2011/nu_mu")
+        directory.create_dataset("area", data=area)
+        directory.create_dataset("bin_edges_0", data=true_energy_bins)
+        directory.create_dataset("bin_edges_1", data=cos_zenith_bins)
+        directory.create_dataset("bin_edges_2", data=reco_energy_bins)
+
+    return str(filename)
@@ -1,7 +1,12 @@
 import numpy as np
-from pytest import approx, raises
-from icecube_tools.utils.vMF import get_kappa, get_theta_p
-from icecube_tools.detector.angular_resolution import AngularResolution
+from pytest import approx, raises, mark
+from icecube_tools.utils.vMF import get_kappa, get_theta_p, sample_vMF
+from icecube_tools.detector.angular_resolution import (
+    AngularResolution,
+    FixedAngularResolution,
+    icrs_to_unit_vector,
+    unit_vector_to_icrs,
+)
 from icecube_tools.detector.r2021 import R2021IRF
 
 def test_kappa_conversion():
@@ -15,6 +20,50 @@ def test_kappa_conversion():
     assert theta_1sigma == approx(theta_p)
 
 
+@mark.parametrize("dec", [-np.pi / 2, 0.3, np.pi / 2])
+@mark.parametrize("kappa", [0.5, 5.0, 50.0, 5000.0])
+def test_sample_vMF(kappa, dec):
+
+    N = 100000
+    rng = np.random.default_rng(42)
+
+    mu = icrs_to_unit_vector(np.full(N, 1.0), np.full(N, dec))
+
+    x, y, z = sample_vMF(mu, kappa, rng=rng)
+
+    assert x.shape == (N,)
+    assert np.sqrt(x**2 + y**2 + z**2) == approx(1.0)
+
+    # Mean cosine of the angle to mu is coth(kappa) - 1/kappa,
+    # compared as 1 - w to resolve large kappa
+    w = x * mu[0] + y * mu[1] + z * mu[2]
+
+    assert np.mean(1 - w) == approx(1 - 1 / np.tanh(kappa) + 1 / kappa, rel=0.02)
+
+
+def test_unit_vector_round_trip():
+
+    # Covers the quadrants where arctan(y / x) alone is wrong
+    ra = np.linspace(0.55 * np.pi, 1.45 * np.pi, 7)
+    dec = np.linspace(-1.2, 1.2, 7)
+
+    new_ra, new_dec = unit_vector_to_icrs(icrs_to_unit_vector(ra, dec))
+
+    assert new_ra == approx(ra)
+    assert new_dec == approx(dec)
+
+    # x == 0 exactly
+    new_ra, new_dec = unit_vector_to_icrs((0.0, 1.0, 0.0))
+
+    assert new_ra == approx(np.pi / 2)
+    assert new_dec == approx(0.0)
+
+    new_ra, new_dec = unit_vector_to_icrs((0.0, -0.6, 0.8))
+
+    assert new_ra == approx(3 * np.pi / 2)
+    assert new_dec == approx(np.arcsin(0.8))
+
+
 def test_angular_resolution():
 
     # Load
@@ -35,6 +84,40 @@ def test_angular_resolution():
     assert ang_res.ret_ang_err == ang_res.get_ret_ang_err(Etrue)
 
 
+def test_fixed_angular_resolution():
+
+    ang_res = FixedAngularResolution(ang_err=1.0, ang_err_p=0.68, ret_ang_err_p=0.9)
+
+    assert ang_res.ret_ang_err_p == 0.9
+    assert ang_res.ret_ang_err == approx(get_theta_p(ang_res.kappa, 0.9))
+
+    rng = np.random.default_rng(42)
+
+    # Scalar in, scalar out
+    ra, dec = ang_res.sample((1.0, 0.5), rng=rng)
+
+    assert np.ndim(ra) == 0 and np.ndim(dec) == 0
+    assert 0 <= ra < 2 * np.pi
+    assert -np.pi / 2 <= dec <= np.pi / 2
+
+    # Array in, array out
+    N = 10000
+    ra_true = np.full(N, 1.0)
+    dec_true = np.full(N, 0.5)
+
+    ra, dec = ang_res.sample((ra_true, dec_true), rng=rng)
+
+    assert ra.shape == (N,) and dec.shape == (N,)
+
+    # Angular distance to the true position
+    cos_dist = np.sin(dec) * np.sin(dec_true) + np.cos(dec) * np.cos(
+        dec_true
+    ) * np.cos(ra - ra_true)
+    dist = np.rad2deg(np.arccos(np.clip(cos_dist, -1, 1)))
+
+    assert np.mean(dist < ang_res.ang_err) == approx(0.68, abs=0.02)
+
+
 def test_r2021_irf():
 
     # Load
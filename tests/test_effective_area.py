@@ -0,0 +1,54 @@
+import numpy as np
+from pytest import approx
+
+from icecube_tools.detector.effective_area import EffectiveArea
+
+
+def test_detection_probability(synthetic_aeff_file):
+
+    aeff = EffectiveArea(synthetic_aeff_file)
+
+    max_energy = 1e7
+
+    # Reference lookup with np.digitize, for in-range values only
+    scaled_values = aeff.values.copy()
+    scaled_values[aeff.true_energy_bins[:-1] > max_energy] = 0
+    scaled_values = scaled_values / np.max(scaled_values)
+
+    rng = np.random.default_rng(42)
+    true_energy = np.power(10, rng.uniform(2, 9, 1000))
+    cosz = rng.uniform(-1, 1, 1000)
+
+    energy_index = np.digitize(true_energy, aeff.true_energy_bins) - 1
+    cosz_index = np.digitize(cosz, aeff.cos_zenith_bins) - 1
+
+    detection_prob = aeff.detection_probability(true_energy, cosz, max_energy)
+
+    assert detection_prob.shape == true_energy.shape
+    assert detection_prob == approx(scaled_values[energy_index, cosz_index])
+
+    # Scalar in, scalar out
+    p = aeff.detection_probability(true_energy[0], cosz[0], max_energy)
+
+    assert np.ndim(p) == 0
+    assert p == approx(detection_prob[0])
+
+    # Broadcasting keeps the input shape
+    p = aeff.detection_probability(true_energy[:6].reshape(2, 3), 0.1, max_energy)
+
+    assert p.shape == (2, 3)
+
+    # Out-of-range values are assigned to the edge bins
+    E_edge = np.array([1.0, 1e12])
+    cosz_edge = np.array([-1.5, 1.5])
+
+    p = aeff.detection_probability(E_edge[:, np.newaxis], cosz_edge, 1e12)
+
+    full_scale = aeff.values / np.max(aeff.values)
+
+    assert p == approx(full_scale[[0, -1]][:, [0, -1]])
+
+    # The upper cos(zenith) edge belongs to the last bin
+    assert aeff.detection_probability(1e5, 1.0, 1e12) == approx(
+        aeff.detection_probability(1e5, 0.95, 1e12)
+    )
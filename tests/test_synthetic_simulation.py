@@ -0,0 +1,154 @@
+import h5py
+import numpy as np
+from pytest import approx, mark, raises
+from scipy.stats import ks_2samp
+
+from icecube_tools.detector.effective_area import EffectiveArea
+from icecube_tools.detector.energy_resolution import EnergyResolution
+from icecube_tools.detector.angular_resolution import FixedAngularResolution
+from icecube_tools.detector.detector import IceCube
+from icecube_tools.source.flux_model import PowerLawFlux, BrokenPowerLawFlux, PowerLawExpCutoffFlux
+from icecube_tools.source.source_model import DiffuseSource, PointSource, DIFFUSE, POINT
+from icecube_tools.simulator import Simulator, sphere_sample
+
+"""
+Simulator tests on synthetic detector tables,
+runs without downloading any data.
+"""
+
+
+def _rejection_sample(sim, source, N, rng):
+    """
+    Reference sampler: draw from the flux model and sky,
+    then accept with the detection probability.
+    """
+
+    effective_area = sim.detector.effective_area
+    max_energy = source.flux_model._upper_energy
+
+    Earr, dec = [], []
+    n_accepted = 0
+
+    while n_accepted < N:
+
+        E = source.flux_model.sample(10 * N, rng=rng)
+
+        if source.source_type == DIFFUSE:
+            _, d = sphere_sample(v_min=-sim.max_cosz, v_max=-sim.min_cosz, N=10 * N, rng=rng)
+        else:
+            d = np.full(10 * N, source.coord[1])
+
+        p = effective_area.detection_probability(E, -np.sin(d), max_energy)
+        accepted = rng.random(10 * N) < p
+
+        Earr.append(E[accepted])
+        dec.append(d[accepted])
+        n_accepted += accepted.sum()
+
+    return np.concatenate(Earr)[:N], np.concatenate(dec)[:N]
+
+
+@mark.parametrize("source_type", [POINT, DIFFUSE])
+@mark.parametrize(
+    "flux_model",
+    [
+        PowerLawFlux(1e-18, 1e5, 2.2, 1e4, 1e8),
+        BrokenPowerLawFlux(1e-18, 3e5, 1.5, 3.0, 1e4, 1e8),
+        PowerLawExpCutoffFlux(1e-18, 1e5, 0.5, 1e6, 1e4, 1e8),
+    ],
+)
+def test_sample_detected(synthetic_aeff_file, flux_model, source_type):
+
+    aeff = EffectiveArea(synthetic_aeff_file)
+    detector = IceCube(aeff, None, FixedAngularResolution())
+
+    if source_type == POINT:
+        source = PointSource(flux_model, z=0.0, coord=(1.0, -0.3))
+    else:
+        source = DiffuseSource(flux_model, z=0.0)
+
+    simulator = Simulator(source, detector, "IC86_II")
+    simulator.max_cosz = 0.5
+
+    N = 20000
+
+    Earr, ra, dec = simulator._sample_detected(source, N, np.random.default_rng(42))
+
+    Earr_ref, dec_ref = _rejection_sample(
+        simulator, source, N, np.random.default_rng(43)
+    )
+
+    assert Earr.shape == ra.shape == dec.shape == (N,)
+    assert np.all((Earr >= flux_model._lower_energy) & (Earr <= flux_model._upper_energy))
+
+    assert ks_2samp(np.log10(Earr), np.log10(Earr_ref)).pvalue > 0.01
+
+    if source_type == POINT:
+        assert np.all(ra == 1.0) and np.all(dec == -0.3)
+
+    else:
+        assert np.all(-np.sin(dec) <= simulator.max_cosz)
+        assert ks_2samp(dec, dec_ref).pvalue > 0.01
+
+
+def test_sample_detected_zero_weight(synthetic_aeff_file):
+
+    aeff = EffectiveArea(synthetic_aeff_file)
+
+    # No acceptance in the last cos(zenith) bin, i.e. close to dec = -pi/2
+    aeff.values[:, -1] = 0
+
+    detector = IceCube(aeff, None, FixedAngularResolution())
+    source = PointSource(PowerLawFlux(1e-18, 1e5, 2.2, 1e4, 1e8), coord=(0.0, -1.5))
+
+    simulator = Simulator(source, detector, "IC86_II")
+    rng = np.random.default_rng(42)
+
+    with raises(ValueError):
+        simulator._sample_detected(source, 10, rng)
+
+    # Flux bounds outside of the effective area energy range
+    source = PointSource(PowerLawFlux(1e-18, 1e10, 2.2, 1e10, 1e11), coord=(0.0, 0.3))
+
+    with raises(ValueError):
+        simulator._sample_detected(source, 10, rng)
+
+
+def test_save(synthetic_aeff_file, synthetic_eres_file, output_directory):
+
+    aeff = EffectiveArea(synthetic_aeff_file)
+
+    eres = EnergyResolution(synthetic_eres_file)
+
+    detector = IceCube(aeff, eres, FixedAngularResolution())
+
+    flux = PowerLawFlux(1e-18, 1e5, 2.2, 1e4, 1e8)
+    simulator = Simulator(
+        [PointSource(flux, coord=(1.0, 0.3)), DiffuseSource(flux)], detector, "IC86_II"
+    )
+
+    N = 500
+    simulator.run(N=N, seed=42, show_progress=False)
+
+    filename = str(output_directory.join("simulation.h5"))
+    simulator.save(filename)
+
+    with h5py.File(filename, "r") as f:
+
+        for key in [
+            "true_energy",
+            "arrival_energy",
+            "reco_energy",
+            "ra",
+            "dec",
+            "ang_err",
+            "source_label",
+        ]:
+
+            assert f[key].shape == (N,)
+            assert f[key].compression == "lzf"
+
+        assert f["ra"][()] == approx(simulator.ra["IC86_II"])
+
+        assert f["source_0/index"][()] == approx(2.2)
+        assert "source_1" in f